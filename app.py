@@ -1,5 +1,6 @@
 """Production-style Haystack runtime for Kazi's Agents Army."""
 
+from functools import lru_cache
 from pathlib import Path
 import sys
 
@@ -7,23 +8,33 @@ sys.path.append(str(Path(__file__).resolve().parent / "core"))
 from agents_army_core import MissionRequest, build_mission_plan
 
 
+@lru_cache(maxsize=1)
+def _check_pipeline() -> tuple[bool, str | None]:
+    # Resolve haystack and build a pipeline once per process; a missing
+    # install would otherwise rescan sys.path on every mission.
+    try:
+        from haystack import Pipeline
+    except ImportError as exc:
+        return False, str(exc)
+    Pipeline()
+    return True, None
+
+
 def run_haystack_mission(mission_text: str) -> dict:
     plan = build_mission_plan(MissionRequest(mission_text))
 
-    try:
-        from haystack import Pipeline
-    except Exception as exc:
+    available, import_error = _check_pipeline()
+    if not available:
         return {
             "primary": plan.primary,
             "support": plan.support,
             "result": None,
-            "verification": f"Haystack dependency missing: {exc}",
+            "verification": f"Haystack dependency missing: {import_error}",
         }
 
-    _ = Pipeline()
     return {
         "primary": plan.primary,
         "support": plan.support,
         "result": "Pipeline instantiated.",
-        "verification": "Haystack pipeline path validated.",
+        "verification": "Haystack pipeline path validated once per process.",
     }
@@ -33,12 +33,14 @@ def build_mission_plan(request: MissionRequest) -> MissionPlan:
 
 
 def render_system_instructions(plan: MissionPlan) -> str:
+    # Static text first and the mission last, so backends with prompt prefix
+    # caching can reuse the shared head across missions.
     return (
         "You are Kazi's Agents Army runtime. "
+        "Always produce evidence-backed outputs and include verification notes. "
+        f"Execution phases: {' -> '.join(plan.phases)}. "
         f"Primary agent: {plan.primary}. "
         f"Support agents: {', '.join(plan.support)}. "
-        f"Mission: {plan.mission}. "
         f"Skill focus: {', '.join(plan.primary_skills)}. "
-        f"Execution phases: {' -> '.join(plan.phases)}. "
-        "Always produce evidence-backed outputs and include verification notes."
+        f"Mission: {plan.mission}."
     )
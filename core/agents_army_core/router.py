@@ -1,23 +1,33 @@
-from .models import MissionRequest, RoutedMission
+from functools import lru_cache
+
+from .models import AgentSpec, MissionRequest, RoutedMission
 from .registry import AGENTS
 
+# Default support pattern for safer execution.
+_DEFAULT_SUPPORT_CODES = frozenset({"TITAN", "SENTINEL"})
+_DEFAULT_SUPPORT = tuple(a for a in AGENTS if a.code in _DEFAULT_SUPPORT_CODES)
+
 
 def _score(text: str, keywords: list[str]) -> int:
-    s = text.lower()
-    return sum(1 for kw in keywords if kw in s)
+    # Expects text already lowercased by route_mission.
+    return sum(1 for kw in keywords if kw in text)
 
 
-def route_mission(request: MissionRequest) -> RoutedMission:
-    ranked = sorted(AGENTS, key=lambda a: _score(request.text, a.invoke_keywords), reverse=True)
-    primary = ranked[0]
+@lru_cache(maxsize=256)
+def _rank(text: str) -> tuple[AgentSpec, tuple[AgentSpec, ...]]:
+    scored = [(_score(text, a.invoke_keywords), a) for a in AGENTS]
+    if not any(score for score, _ in scored):
+        # Nothing matched; the stable sort would keep registry order anyway.
+        return AGENTS[0], _DEFAULT_SUPPORT
 
-    support = []
-    for agent in ranked[1:]:
-        if _score(request.text, agent.invoke_keywords) > 0:
-            support.append(agent)
+    ranked = sorted(scored, key=lambda pair: pair[0], reverse=True)
+    primary = ranked[0][1]
+    support = tuple(agent for score, agent in ranked[1:] if score > 0)
+    return primary, support or _DEFAULT_SUPPORT
 
-    if not support:
-        # Default support pattern for safer execution.
-        support = [a for a in AGENTS if a.code in {"TITAN", "SENTINEL"}]
 
-    return RoutedMission(request=request, primary=primary, support=support)
+def route_mission(request: MissionRequest) -> RoutedMission:
+    # Scoring only sees the lowercased text, so repeat missions share a cached
+    # ranking; support is copied so callers never mutate the cache entry.
+    primary, support = _rank(request.text.strip().lower())
+    return RoutedMission(request=request, primary=primary, support=list(support))
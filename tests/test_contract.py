@@ -1,4 +1,15 @@
+import sys
+import types
+
+import app
 from app import run_haystack_mission
+from agents_army_core import (
+    MissionRequest,
+    build_mission_plan,
+    render_system_instructions,
+    route_mission,
+)
+from agents_army_core.router import _rank
 
 
 def test_mission_contract_returns_routing_and_verification():
@@ -13,3 +24,52 @@ def test_skill_routing_selects_security_for_audit_mission():
     result = run_haystack_mission("secure audit and threat model the workflow")
 
     assert result["primary"] == "SENTINEL"
+
+
+def test_repeated_missions_reuse_cached_routing():
+    first = route_mission(MissionRequest("refactor the deploy workflow"))
+    first.support.append("MUTATED")
+    hits = _rank.cache_info().hits
+    second = route_mission(MissionRequest("  Refactor the DEPLOY workflow "))
+
+    assert _rank.cache_info().hits == hits + 1
+    assert second.primary == first.primary
+    assert isinstance(second.support, list)
+    assert "MUTATED" not in second.support
+
+
+def test_unmatched_mission_falls_back_to_default_support():
+    result = run_haystack_mission("hello there")
+
+    assert sorted(result["support"]) == ["SENTINEL", "TITAN"]
+
+
+def test_system_instructions_keep_mission_last():
+    plans = [
+        build_mission_plan(MissionRequest("audit the ledger")),
+        build_mission_plan(MissionRequest("audit the inventory")),
+    ]
+    prefixes = []
+    for plan in plans:
+        rendered = render_system_instructions(plan)
+        assert rendered.endswith(f"Mission: {plan.mission}.")
+        prefixes.append(rendered[: rendered.index("Mission:")])
+
+    assert plans[0].primary == plans[1].primary
+    assert prefixes[0] == prefixes[1]
+
+
+def test_haystack_pipeline_is_checked_once(monkeypatch):
+    built = []
+    haystack = types.ModuleType("haystack")
+    haystack.Pipeline = lambda: built.append(True)
+    monkeypatch.setitem(sys.modules, "haystack", haystack)
+    app._check_pipeline.cache_clear()
+    try:
+        first = run_haystack_mission("build secure api")
+        second = run_haystack_mission("deploy the docs pipeline")
+    finally:
+        app._check_pipeline.cache_clear()
+
+    assert first["result"] == second["result"] == "Pipeline instantiated."
+    assert len(built) == 1